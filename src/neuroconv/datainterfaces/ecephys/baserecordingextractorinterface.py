@@ -83,7 +83,9 @@ class BaseRecordingExtractorInterface(BaseExtractorInterface):
         metadata = super().get_metadata()
 
         channel_groups_array = self.recording_extractor.get_channel_groups()
-        unique_channel_groups = set(channel_groups_array) if channel_groups_array is not None else ["ElectrodeGroup"]
+        unique_channel_groups = (
+            np.unique(channel_groups_array) if channel_groups_array is not None else ["ElectrodeGroup"]
+        )
         electrode_metadata = [
             dict(name=str(group_id), description="no description", location="unknown", device="DeviceEcephys")
             for group_id in unique_channel_groups
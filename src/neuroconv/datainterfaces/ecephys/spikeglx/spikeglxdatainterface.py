@@ -80,14 +80,15 @@ class SpikeGLXRecordingInterface(BaseRecordingExtractorInterface):
 
         # Add groups metadata
         metadata["Ecephys"]["Device"] = [device]
+        unique_group_names = np.unique(self.recording_extractor.get_property("group_name"))
         electrode_groups = [
             dict(
-                name=group_name,
+                name=str(group_name),
                 description=f"a group representing shank {group_name}",
                 location="unknown",
                 device=device["name"],
             )
-            for group_name in set(self.recording_extractor.get_property("group_name"))
+            for group_name in unique_group_names
         ]
         metadata["Ecephys"]["ElectrodeGroup"] = electrode_groups
 
@@ -1,11 +1,11 @@
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
 from .spikeglx_utils import get_device_metadata, get_session_start_time
 from ..baserecordingextractorinterface import BaseRecordingExtractorInterface
-from ....tools.signal_processing import get_rising_frames_from_ttl
+from ....tools.signal_processing import _get_sign_relative_to_threshold
 from ....utils import FilePathType, get_schema_from_method_signature
 
 
@@ -63,6 +63,7 @@ class SpikeGLXNIDQInterface(BaseRecordingExtractorInterface):
             key="group_name", values=["NIDQChannelGroup"] * self.recording_extractor.get_num_channels()
         )
         self.meta = self.recording_extractor.neo_reader.signals_info_dict[(0, "nidq")]["meta"]
+        self._device_metadata = get_device_metadata(self.meta)  # The header is fixed, so only serialize it once
 
     def get_metadata(self) -> dict:
         metadata = super().get_metadata()
@@ -72,27 +73,36 @@ class SpikeGLXNIDQInterface(BaseRecordingExtractorInterface):
             metadata["NWBFile"]["session_start_time"] = session_start_time
 
         # Device metadata
-        device = get_device_metadata(self.meta)
+        device = dict(self._device_metadata)  # Copied so edits to the returned metadata do not affect later calls
 
         # Add groups metadata
         metadata["Ecephys"]["Device"] = [device]
 
-        metadata["Ecephys"]["ElectrodeGroup"][0].update(
-            name="NIDQChannelGroup", description="A group representing the NIDQ channels.", device=device["name"]
+        # Build every group from the `group_name` property rather than patching the first default group in place,
+        # which would otherwise leave any remaining groups pointing to the default device
+        electrode_group_template = dict(
+            description="A group representing the NIDQ channels.", location="unknown", device=device["name"]
         )
+        unique_group_names = np.unique(self.recording_extractor.get_property("group_name"))
+        metadata["Ecephys"]["ElectrodeGroup"] = [
+            dict(name=str(group_name), **electrode_group_template) for group_name in unique_group_names
+        ]
         metadata["Ecephys"]["Electrodes"] = [
             dict(name="group_name", description="Name of the ElectrodeGroup this electrode is a part of."),
         ]
-        metadata["Ecephys"]["ElectricalSeriesNIDQ"][
-            "description"
-        ] = "Raw acquisition traces from the NIDQ (.nidq.bin) channels."
+        if self.es_key is not None:
+            metadata["Ecephys"][self.es_key][
+                "description"
+            ] = "Raw acquisition traces from the NIDQ (.nidq.bin) channels."
         return metadata
 
     def get_channel_names(self) -> List[str]:
         """Return a list of channel names as set in the recording extractor."""
         return list(self.recording_extractor.get_channel_ids())
 
-    def get_event_times_from_ttl(self, channel_name: str) -> np.ndarray:
+    def get_event_times_from_ttl(
+        self, channel_name: str, buffer_frames: int = 10_000_000, threshold: Optional[float] = None
+    ) -> np.ndarray:
         """
         Return the start of event times from the rising part of TTL pulses on one of the NIDQ channels.
 
@@ -100,18 +110,54 @@ class SpikeGLXNIDQInterface(BaseRecordingExtractorInterface):
         ----------
         channel_name : str
             Name of the channel in the .nidq.bin file.
+        buffer_frames : int, default: 10,000,000
+            The maximum number of frames of the channel to load into memory at any one time.
+        threshold : float, optional
+            The value the TTL signal must cross to count as a rising event.
+            The default is the mean value of the channel, which requires an additional full pass over the channel
+            to compute; specify the known TTL level to read the channel only once.
 
         Returns
         -------
         rising_times : numpy.ndarray
             The times of the rising TTL pulses.
         """
-        # TODO: consider RAM cost of these operations and implement safer buffering version
-        rising_frames = get_rising_frames_from_ttl(
-            trace=self.recording_extractor.get_traces(channel_ids=[channel_name])
-        )
+        assert buffer_frames > 0, f"buffer_frames ({buffer_frames}) must be greater than zero!"
+
+        num_frames = self.recording_extractor.get_num_frames()
+        if num_frames == 0:
+            return self.recording_extractor.sample_index_to_time(np.empty(shape=0, dtype="int64"))
+
+        buffer_bounds = [
+            (start_frame, min(start_frame + buffer_frames, num_frames))
+            for start_frame in range(0, num_frames, buffer_frames)
+        ]
 
-        nidq_timestamps = self.recording_extractor.get_times()
-        rising_times = nidq_timestamps[rising_frames]
+        def _get_buffered_trace(start_frame: int, end_frame: int) -> np.ndarray:
+            trace = self.recording_extractor.get_traces(
+                channel_ids=[channel_name], start_frame=start_frame, end_frame=end_frame
+            )
+            return trace.ravel()
+
+        # Same default threshold as `get_rising_frames_from_ttl` (the mean of the trace), accumulated per buffer
+        if threshold is None:
+            threshold = sum(
+                np.sum(_get_buffered_trace(start_frame=start_frame, end_frame=end_frame), dtype="float64")
+                for start_frame, end_frame in buffer_bounds
+            )
+            threshold /= num_frames
+
+        # The sign of the last frame of each buffer is carried over to detect rising events across buffer boundaries
+        all_rising_frames = list()
+        previous_sign = np.empty(shape=0, dtype="int8")
+        for start_frame, end_frame in buffer_bounds:
+            trace = _get_buffered_trace(start_frame=start_frame, end_frame=end_frame)
+            sign = _get_sign_relative_to_threshold(trace=trace, threshold=threshold)
+            diff = np.diff(np.concatenate((previous_sign, sign)))
+            all_rising_frames.append(np.flatnonzero(diff > 0) + start_frame + 1 - previous_sign.shape[0])
+            previous_sign = sign[-1:]
+        rising_frames = np.concatenate(all_rising_frames)
+
+        rising_times = self.recording_extractor.sample_index_to_time(rising_frames)
 
         return rising_times
@@ -1,20 +1,33 @@
 """Collection of helper functions for assessing and performing automated data transfers related to AWS."""
 
+from typing import Union
+
+import numpy as np
+
+
+def _get_s3_conversion_rate_coefficient(
+    transfer_rate_mb: float, conversion_rate_mb: float, upload_rate_mb: float, compression_ratio: float
+) -> float:
+    """Coefficient of the quadratic relation between the total amount of data and the total MB-seconds of storage."""
+    c = 1 / compression_ratio  # compressed_size = total_size * c
+    return 1 / transfer_rate_mb + (2 * c + 1) / conversion_rate_mb + 2 * c**2 / upload_rate_mb
+
 
 def estimate_s3_conversion_cost(
-    total_mb: float,
+    total_mb: Union[float, np.ndarray],
     transfer_rate_mb: float = 20.0,
     conversion_rate_mb: float = 17.0,
     upload_rate_mb: float = 40.0,
     compression_ratio: float = 1.7,
-):
+) -> Union[float, np.ndarray]:
     """
     Estimate potential cost of performing an entire conversion on S3 using full automation.
 
     Parameters
     ----------
-    total_mb: float
+    total_mb: float or numpy.ndarray
         The total amount of data (in MB) that will be transferred, converted, and uploaded to dandi.
+        An array of sizes may be passed to estimate the cost of each in a single vectorized operation.
     transfer_rate_mb : float, default: 20.0
         Estimate of the transfer rate for the data.
     conversion_rate_mb : float, default: 17.0
@@ -25,8 +38,13 @@ def estimate_s3_conversion_cost(
     compression_ratio : float, default: 1.7
         Estimate of the final average compression ratio for datasets in the file. Can vary widely.
     """
-    c = 1 / compression_ratio  # compressed_size = total_size * c
-    total_mb_s = total_mb**2 / 2 * (1 / transfer_rate_mb + (2 * c + 1) / conversion_rate_mb + 2 * c**2 / upload_rate_mb)
+    rate_coefficient = _get_s3_conversion_rate_coefficient(
+        transfer_rate_mb=transfer_rate_mb,
+        conversion_rate_mb=conversion_rate_mb,
+        upload_rate_mb=upload_rate_mb,
+        compression_ratio=compression_ratio,
+    )
+    total_mb_s = total_mb**2 / 2 * rate_coefficient
     cost_gb_m = 0.08 / 1e3  # $0.08 / GB Month
     cost_mb_s = cost_gb_m / (1e3 * 2.628e6)  # assuming 30 day month; unsure how amazon weights shorter months?
     return cost_mb_s * total_mb_s
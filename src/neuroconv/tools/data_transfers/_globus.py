@@ -24,12 +24,17 @@ def get_globus_dataset_content_sizes(
     assert is_package_installed(package_name="globus_cli"), "You must install the globus CLI (pip install globus-cli)!"
 
     recursive_flag = " --recursive" if recursive else ""
-    contents = json.loads(
+    # Project the listing down to (name, size) pairs of files only before it is emitted by the CLI
+    # This avoids buffering and decoding the full metadata of every entry for very large directories
+    file_projection = "--jmespath \"DATA[?type=='file'].[name, size]\""
+    names_and_sizes = json.loads(
         deploy_process(
-            command=f"globus ls -Fjson {globus_endpoint_id}:{path}{recursive_flag}", catch_output=True, timeout=timeout
+            command=f"globus ls -Fjson {file_projection} {globus_endpoint_id}:{path}{recursive_flag}",
+            catch_output=True,
+            timeout=timeout,
         )
     )
-    files_and_sizes = {item["name"]: item["size"] for item in contents["DATA"] if item["type"] == "file"}
+    files_and_sizes = dict(names_and_sizes)
     return files_and_sizes
 
 
@@ -165,6 +170,8 @@ def transfer_globus_content(
                 sleep(progress_update_rate)
         return success
 
+    assert is_package_installed(package_name="globus_cli"), "You must install the globus CLI (pip install globus-cli)!"
+
     source_files = [[source_files]] if isinstance(source_files, str) else source_files
     destination_folder_path = Path(destination_folder)
     destination_folder_path.mkdir(exist_ok=True)
@@ -133,6 +133,15 @@ class DatasetIOConfiguration(BaseModel, ABC):
         """
         raise NotImplementedError
 
+    def __hash__(self) -> int:
+        """
+        Hash only the frozen fields that identify the dataset, so the value is stable as the model is configured.
+
+        Equal configurations always share these fields, while the user specifiable fields may still be mutated freely.
+        The string hashes of the identifiers are already cached by the interpreter, making this cheap to recompute.
+        """
+        return hash((self.object_id, self.location_in_file, self.dataset_name, self.full_shape, self.dtype))
+
     def __str__(self) -> str:
         """
         Not overriding __repr__ as this is intended to render only when wrapped in print().
@@ -241,6 +250,40 @@ class DatasetIOConfiguration(BaseModel, ABC):
             Some neurodata objects can have multiple such fields, such as `pynwb.TimeSeries` which can have both `data`
             and `timestamps`, each of which can be configured separately.
         """
+        return cls(**cls._get_default_fields(neurodata_object=neurodata_object, dataset_name=dataset_name))
+
+    @classmethod
+    def from_neurodata_object_trusted(
+        cls, neurodata_object: Container, dataset_name: Literal["data", "timestamps"]
+    ) -> Self:
+        """
+        Construct the default DatasetIOConfiguration for a dataset in a neurodata object without model validation.
+
+        The default fields are either derived by our own estimators or taken from a `GenericDataChunkIterator`, which
+        already enforces consistency between its chunk and buffer shapes, so re-validating them for every dataset in a
+        large file is redundant. Assignments made to the returned instance are still validated as usual.
+
+        Parameters
+        ----------
+        neurodata_object : hdmf.Container
+            The neurodata object containing the field that will become a dataset when written to disk.
+        dataset_name : "data" or "timestamps"
+            The name of the field that will become a dataset when written to disk.
+        """
+        fields = cls._get_default_fields(neurodata_object=neurodata_object, dataset_name=dataset_name)
+
+        # Apply the coercions validation would have performed on the shapes
+        for shape_name in ("full_shape", "chunk_shape", "buffer_shape"):
+            if fields[shape_name] is not None:
+                fields[shape_name] = tuple(int(axis) for axis in fields[shape_name])
+
+        return cls.model_construct(**fields)
+
+    @classmethod
+    def _get_default_fields(
+        cls, neurodata_object: Container, dataset_name: Literal["data", "timestamps"]
+    ) -> Dict[str, Any]:
+        """Determine the default values of the fields for a dataset in a neurodata object in an NWBFile."""
         location_in_file = _find_location_in_memory_nwbfile(neurodata_object=neurodata_object, field_name=dataset_name)
 
         candidate_dataset = getattr(neurodata_object, dataset_name)
@@ -264,9 +307,8 @@ class DatasetIOConfiguration(BaseModel, ABC):
             buffer_shape = None
             compression_method = None
 
-        return cls(
+        return dict(
             object_id=neurodata_object.object_id,
-            object_name=neurodata_object.name,
             location_in_file=location_in_file,
             dataset_name=dataset_name,
             full_shape=full_shape,
@@ -1,10 +1,11 @@
 """Collection of helper functions related to configuration of datasets dependent on backend."""
 
-from typing import Generator, Literal, Union
+from typing import Any, Callable, Generator, Literal, Union
 
 import h5py
 import numpy as np
 import zarr
+from hdmf.container import Data
 from hdmf.data_utils import DataIO
 from hdmf_zarr import NWBZarrIO
 from pynwb import NWBHDF5IO, NWBFile
@@ -21,28 +22,34 @@ def _get_io_mode(io: Union[NWBHDF5IO, NWBZarrIO]) -> str:
         return io._ZarrIO__mode
 
 
-def _is_dataset_written_to_file(
-    candidate_dataset: Union[h5py.Dataset, zarr.Array],
+def _get_is_dataset_written_to_file(
     backend: Literal["hdf5", "zarr"],
     existing_file: Union[h5py.File, zarr.Group, None],
-) -> bool:
+) -> Callable[[Any], bool]:
     """
-    Determine if the neurodata object is already written to the file on disk.
+    Specialize the check of whether a candidate dataset is already written to the file on disk for a given backend.
 
-    This object should then be skipped by the `get_io_datasets` function when working in append mode.
+    The returned callable should then be used by the `get_default_dataset_io_configurations` function to skip
+    objects when working in append mode.
     """
     if existing_file is None:
-        return False
 
-    return (
-        isinstance(candidate_dataset, h5py.Dataset)  # If the source data is an HDF5 Dataset
-        and backend == "hdf5"
-        and candidate_dataset.file == existing_file  # If the source HDF5 Dataset is the appending NWBFile
-    ) or (
-        isinstance(candidate_dataset, zarr.Array)  # If the source data is a Zarr Array
-        and backend == "zarr"
-        and candidate_dataset.store == existing_file  # If the source Zarr 'file' is the appending NWBFile
-    )
+        def _is_dataset_written_to_file(candidate_dataset: Any) -> bool:
+            return False
+
+    elif backend == "hdf5":
+
+        def _is_dataset_written_to_file(candidate_dataset: Any) -> bool:
+            # If the source data is an HDF5 Dataset and is the appending NWBFile
+            return isinstance(candidate_dataset, h5py.Dataset) and candidate_dataset.file == existing_file
+
+    else:
+
+        def _is_dataset_written_to_file(candidate_dataset: Any) -> bool:
+            # If the source data is a Zarr Array and its 'file' is the appending NWBFile
+            return isinstance(candidate_dataset, zarr.Array) and candidate_dataset.store == existing_file
+
+    return _is_dataset_written_to_file
 
 
 def get_default_dataset_io_configurations(
@@ -70,14 +77,12 @@ def get_default_dataset_io_configurations(
     """
     from ..nwb_helpers import DATASET_IO_CONFIGURATIONS
 
-    DatasetIOConfigurationClass = DATASET_IO_CONFIGURATIONS[backend]
-
     if backend is None and nwbfile.read_io is None:
         raise ValueError(
             "Keyword argument `backend` (either 'hdf5' or 'zarr') must be specified if the `nwbfile` was not "
             "read from an existing file!"
         )
-    if backend is None and nwbfile.read_io is not None and nwbfile.read_io.mode not in ("r+", "a"):
+    if backend is None and nwbfile.read_io is not None and _get_io_mode(io=nwbfile.read_io) not in ("r+", "a"):
         raise ValueError(
             "Keyword argument `backend` (either 'hdf5' or 'zarr') must be specified if the `nwbfile` is being appended."
         )
@@ -98,51 +103,61 @@ def get_default_dataset_io_configurations(
             f"({backend}) does not match! Set `backend=None` or remove the keyword argument to allow it to auto-detect."
         )
 
+    DatasetIOConfigurationClass = DATASET_IO_CONFIGURATIONS[backend]
+    is_dataset_written_to_file = _get_is_dataset_written_to_file(backend=backend, existing_file=existing_file)
+
+    # Partition the objects by type in a single pass so each group can be handled by its own specialized loop
+    # The flat `nwbfile.objects` registry is used rather than the typed containers (acquisition, processing, etc.)
+    # since it also reaches objects nested within data interfaces and extension types
+    dynamic_tables = list()
+    time_series_objects = list()  # Primarily for TimeSeries, but also any extended class with 'data' or 'timestamps'
     for neurodata_object in nwbfile.objects.values():
         if isinstance(neurodata_object, DynamicTable):
-            dynamic_table = neurodata_object  # for readability
-
-            for column in dynamic_table.columns:
-                candidate_dataset = column.data  # VectorData object
-                if _is_dataset_written_to_file(
-                    candidate_dataset=candidate_dataset, backend=backend, existing_file=existing_file
-                ):
-                    continue  # skip
-
-                # Skip over columns that are already wrapped in DataIO
-                if isinstance(candidate_dataset, DataIO):
-                    continue
-
-                dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object(
-                    neurodata_object=column, dataset_name="data"
-                )
-
-                yield dataset_io_configuration
+            dynamic_tables.append(neurodata_object)
+        elif isinstance(neurodata_object, Data):
+            continue  # Table columns and ids have no fields of their own; they are configured through their table
         else:
-            # Primarily for TimeSeries, but also any extended class that has 'data' or 'timestamps'
-            # The most common example of this is ndx-events Events/LabeledEvents types
-            time_series = neurodata_object  # for readability
-
-            for dataset_name in ("data", "timestamps"):
-                if dataset_name not in time_series.fields:  # timestamps is optional
-                    continue
-
-                candidate_dataset = getattr(time_series, dataset_name)
-                if _is_dataset_written_to_file(
-                    candidate_dataset=candidate_dataset, backend=backend, existing_file=existing_file
-                ):
-                    continue  # skip
-
-                # Skip over datasets that are already wrapped in DataIO
-                if isinstance(candidate_dataset, DataIO):
-                    continue
-
-                # Edge case of in-memory ImageSeries with external mode; data is in fields and is empty array
-                if isinstance(candidate_dataset, np.ndarray) and candidate_dataset.size == 0:
-                    continue  # skip
-
-                dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object(
-                    neurodata_object=time_series, dataset_name=dataset_name
-                )
-
-                yield dataset_io_configuration
+            neurodata_object_fields = neurodata_object.fields
+            if "data" in neurodata_object_fields or "timestamps" in neurodata_object_fields:
+                time_series_objects.append(neurodata_object)
+
+    for dynamic_table in dynamic_tables:
+        for column in dynamic_table.columns:
+            candidate_dataset = column.data  # VectorData object
+            if is_dataset_written_to_file(candidate_dataset=candidate_dataset):
+                continue  # skip
+
+            # Skip over columns that are already wrapped in DataIO
+            if isinstance(candidate_dataset, DataIO):
+                continue
+
+            dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object_trusted(
+                neurodata_object=column, dataset_name="data"
+            )
+
+            yield dataset_io_configuration
+
+    # The most common example of an extended class is the ndx-events Events/LabeledEvents types
+    for time_series in time_series_objects:
+        time_series_fields = time_series.fields
+        for dataset_name in ("data", "timestamps"):
+            if dataset_name not in time_series_fields:  # timestamps is optional
+                continue
+
+            candidate_dataset = getattr(time_series, dataset_name)
+            if is_dataset_written_to_file(candidate_dataset=candidate_dataset):
+                continue  # skip
+
+            # Skip over datasets that are already wrapped in DataIO
+            if isinstance(candidate_dataset, DataIO):
+                continue
+
+            # Edge case of in-memory ImageSeries with external mode; data is in fields and is empty array
+            if isinstance(candidate_dataset, np.ndarray) and candidate_dataset.size == 0:
+                continue  # skip
+
+            dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object_trusted(
+                neurodata_object=time_series, dataset_name=dataset_name
+            )
+
+            yield dataset_io_configuration
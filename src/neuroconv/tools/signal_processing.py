@@ -3,6 +3,20 @@ from typing import Optional
 import numpy as np
 
 
+def _get_sign_relative_to_threshold(trace: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Return the sign (-1, 0, or 1) of each value of the trace relative to the threshold.
+
+    For integer traces this is computed from two comparisons into an int8 array, avoiding the full size floating point
+    temporaries of `np.sign(trace - threshold)`; differences of consecutive values also fit in the int8 range.
+    Floating point traces keep `np.sign` so that NaN values propagate and never form an edge.
+    """
+    if np.issubdtype(trace.dtype, np.inexact):
+        return np.sign(trace - threshold)
+
+    return np.greater(trace, threshold).view(np.int8) - np.less(trace, threshold).view(np.int8)
+
+
 def get_rising_frames_from_ttl(trace: np.ndarray, threshold: Optional[float] = None) -> np.ndarray:
     """
     Return the frame indices for rising events in a TTL pulse.
@@ -26,7 +40,7 @@ def get_rising_frames_from_ttl(trace: np.ndarray, threshold: Optional[float] = N
 
     threshold = np.mean(trace) if threshold is None else threshold
 
-    sign = np.sign(flattened_trace - threshold)
+    sign = _get_sign_relative_to_threshold(trace=flattened_trace, threshold=threshold)
     diff = np.diff(sign)
     rising_frames = np.where(diff > 0)[0] + 1
 
@@ -56,7 +70,7 @@ def get_falling_frames_from_ttl(trace: np.ndarray, threshold: Optional[float] =
 
     threshold = np.mean(trace) if threshold is None else threshold
 
-    sign = np.sign(flattened_trace - threshold)
+    sign = _get_sign_relative_to_threshold(trace=flattened_trace, threshold=threshold)
     diff = np.diff(sign)
     falling_frames = np.where(diff < 0)[0] + 1
 
@@ -1,5 +1,7 @@
-from typing import Iterable, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generator, Iterable, Iterator, Optional, Tuple
 
+import numpy as np
 from hdmf.data_utils import GenericDataChunkIterator
 from spikeinterface import BaseRecording
 
@@ -18,6 +20,8 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
         chunk_shape: Optional[tuple] = None,
         display_progress: bool = False,
         progress_bar_options: Optional[dict] = None,
+        prefetch: bool = False,
+        read_window_factor: Optional[int] = None,
     ):
         """
         Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
@@ -30,7 +34,8 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
             The recording segment to iterate on.
             Defaults to 0.
         return_scaled : bool, optional
-            Whether to return the trace data in scaled units (uV, if True) or in the raw data type (if False).
+            Whether to return the trace data in scaled units (uV, as float32, if True) or in the raw data type
+            (if False).
             Defaults to False.
         buffer_gb : float, optional
             The upper bound on size in gigabytes (GB) of each selection from the iteration.
@@ -57,11 +62,38 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
         progress_bar_options : dict, optional
             Dictionary of keyword arguments to be passed directly to tqdm.
             See https://github.com/tqdm/tqdm#parameters for options.
+        prefetch : bool, default: False
+            Whether to read the next buffer from the recording in a background thread while the current one is
+            being written. This overlaps reading with compression and writing, at the cost of holding up to two
+            buffers in memory at a time.
+        read_window_factor : int, optional
+            If specified, the frames of this many consecutive buffers are read from the recording across all channels
+            in a single call, and subsequent buffers falling within that window are served from memory.
+            This turns many small reads of an interleaved binary file into fewer large sequential ones, which is most
+            useful when buffers are small or split over channels, at the cost of holding the whole window in memory.
+            The default is None, which reads each buffer from the recording separately.
         """
         self.recording = recording
         self.segment_index = segment_index
         self.return_scaled = return_scaled
         self.channel_ids = recording.get_channel_ids()
+
+        # Cache the static properties of the recording since they are queried repeatedly during the setup
+        self._recording_num_samples = recording.get_num_samples(segment_index=segment_index)
+        self._recording_num_channels = recording.get_num_channels()
+        self._recording_dtype = np.dtype("float32") if return_scaled else recording.get_dtype()
+
+        # Scaling is applied here rather than by the recording to avoid an intermediate copy of each buffer
+        self._gains = None
+        self._offsets = None
+        if return_scaled:
+            if not recording.has_scaled():
+                raise ValueError(
+                    "This recording does not support return_scaled=True (need gain_to_uV and offset_to_uV properties)"
+                )
+            self._gains = recording.get_channel_gains().astype("float32")
+            self._offsets = recording.get_channel_offsets().astype("float32")
+
         super().__init__(
             buffer_gb=buffer_gb,
             buffer_shape=buffer_shape,
@@ -71,31 +103,125 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
             progress_bar_options=progress_bar_options,
         )
 
+        assert (
+            read_window_factor is None or read_window_factor >= 1
+        ), f"read_window_factor ({read_window_factor}) must be at least one!"
+        self.read_window_factor = read_window_factor
+        self._read_window = (0, 0, None)  # Start frame, end frame, and traces across all channels
+
+        self.prefetch = prefetch
+        self._prefetched_selection = None
+        self._prefetched_data = None
+        if self.prefetch:
+            self.buffer_selection_generator = self._prefetch_buffer_selections(
+                buffer_selections=self.buffer_selection_generator
+            )
+
     def _get_default_chunk_shape(self, chunk_mb: float = 10.0) -> Tuple[int, int]:
         assert chunk_mb > 0, f"chunk_mb ({chunk_mb}) must be greater than zero!"
 
         chunk_channels = min(
-            self.recording.get_num_channels(),
+            self._recording_num_channels,
             64,  # from https://github.com/flatironinstitute/neurosift/issues/52#issuecomment-1671405249
         )
         chunk_frames = min(
-            self.recording.get_num_frames(segment_index=self.segment_index),
-            int(chunk_mb * 1e6 / (self.recording.get_dtype().itemsize * chunk_channels)),
+            self._recording_num_samples,
+            int(chunk_mb * 1e6 / (self._recording_dtype.itemsize * chunk_channels)),
         )
 
         return (chunk_frames, chunk_channels)
 
+    def _get_default_buffer_shape(self, buffer_gb: float = 1.0) -> Tuple[int, int]:
+        """
+        Select the buffer_shape less than the threshold of buffer_gb that spans all channels of the recording.
+
+        Each buffer is then a contiguous block of frames made of whole chunks, which is the natural access pattern
+        of the interleaved binary formats most recordings are stored in, and is written as complete chunks.
+        """
+        assert buffer_gb > 0, f"buffer_gb ({buffer_gb}) must be greater than zero!"
+
+        chunk_frames = self.chunk_shape[0]
+        chunk_row_size_bytes = chunk_frames * self._recording_num_channels * self._recording_dtype.itemsize
+        num_chunk_rows = int(buffer_gb * 1e9 / chunk_row_size_bytes)
+        if num_chunk_rows == 0:  # Too many channels to span them all; fall back to also buffering over channels
+            return super()._get_default_buffer_shape(buffer_gb=buffer_gb)
+
+        buffer_frames = min(num_chunk_rows * chunk_frames, self._recording_num_samples)
+        return (buffer_frames, self._recording_num_channels)
+
+    def _prefetch_buffer_selections(
+        self, buffer_selections: Iterator[Tuple[slice]]
+    ) -> Generator[Tuple[slice], None, None]:
+        """Wrap the buffer selections so the read of the following buffer is submitted as each one is handed out."""
+        current_selection = next(buffer_selections, None)
+        if current_selection is None:
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="SpikeInterfacePrefetch") as executor:
+            current_data = executor.submit(self._get_traces, selection=current_selection)
+            for next_selection in buffer_selections:
+                next_data = executor.submit(self._get_traces, selection=next_selection)
+
+                self._prefetched_selection, self._prefetched_data = current_selection, current_data
+                yield current_selection
+
+                current_selection, current_data = next_selection, next_data
+
+            self._prefetched_selection, self._prefetched_data = current_selection, current_data
+            yield current_selection
+
+        self._prefetched_selection, self._prefetched_data = None, None
+
     def _get_data(self, selection: Tuple[slice]) -> Iterable:
-        return self.recording.get_traces(
-            segment_index=self.segment_index,
-            channel_ids=self.channel_ids[selection[1]],
-            start_frame=selection[0].start,
-            end_frame=selection[0].stop,
-            return_scaled=self.return_scaled,
-        )
+        if selection == self._prefetched_selection:
+            prefetched_data: Future = self._prefetched_data
+            self._prefetched_selection, self._prefetched_data = None, None
+            return prefetched_data.result()
+
+        return self._get_traces(selection=selection)
+
+    def _get_traces_from_read_window(self, selection: Tuple[slice]) -> np.ndarray:
+        """Serve the selection from the current read window, first reading a new window if it is not contained."""
+        start_frame, end_frame = selection[0].start, selection[0].stop
+
+        # Unpacked from a single attribute so a prefetching thread never observes a partially updated window
+        window_start_frame, window_end_frame, window_traces = self._read_window
+        if start_frame < window_start_frame or end_frame > window_end_frame:
+            window_start_frame = start_frame
+            window_end_frame = min(
+                start_frame + self.read_window_factor * (end_frame - start_frame), self._recording_num_samples
+            )
+            window_traces = self.recording.get_traces(
+                segment_index=self.segment_index,
+                start_frame=window_start_frame,
+                end_frame=window_end_frame,
+                return_scaled=False,
+            )
+            window_traces = np.array(window_traces)  # Ensure the window is read into memory rather than memory-mapped
+            self._read_window = (window_start_frame, window_end_frame, window_traces)
+
+        return window_traces[start_frame - window_start_frame : end_frame - window_start_frame, selection[1]]
+
+    def _get_traces(self, selection: Tuple[slice]) -> np.ndarray:
+        if self.read_window_factor is not None:
+            traces = self._get_traces_from_read_window(selection=selection)
+        else:
+            traces = self.recording.get_traces(
+                segment_index=self.segment_index,
+                channel_ids=self.channel_ids[selection[1]],
+                start_frame=selection[0].start,
+                end_frame=selection[0].stop,
+                return_scaled=False,
+            )
+        if not self.return_scaled:
+            return traces
+
+        scaled_traces = np.multiply(traces, self._gains[selection[1]], dtype="float32")
+        scaled_traces += self._offsets[selection[1]]
+        return scaled_traces
 
     def _get_dtype(self):
-        return self.recording.get_dtype()
+        return self._recording_dtype
 
     def _get_maxshape(self):
-        return (self.recording.get_num_samples(segment_index=self.segment_index), self.recording.get_num_channels())
+        return (self._recording_num_samples, self._recording_num_channels)
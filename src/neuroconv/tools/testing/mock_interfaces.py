@@ -11,6 +11,7 @@ from ...datainterfaces import SpikeGLXNIDQInterface
 from ...datainterfaces.ecephys.baserecordingextractorinterface import (
     BaseRecordingExtractorInterface,
 )
+from ...datainterfaces.ecephys.spikeglx.spikeglx_utils import get_device_metadata
 from ...datainterfaces.ophys.baseimagingextractorinterface import (
     BaseImagingExtractorInterface,
 )
@@ -65,7 +66,11 @@ class MockSpikeGLXNIDQInterface(SpikeGLXNIDQInterface):
         return source_schema
 
     def __init__(
-        self, signal_duration: float = 7.0, ttl_times: Optional[List[List[float]]] = None, ttl_duration: float = 1.0
+        self,
+        signal_duration: float = 7.0,
+        ttl_times: Optional[List[List[float]]] = None,
+        ttl_duration: float = 1.0,
+        es_key: str = "ElectricalSeriesNIDQ",
     ):
         """
         Define a mock SpikeGLXNIDQInterface by overriding the recording extractor to be a mock TTL signal.
@@ -81,6 +86,7 @@ class MockSpikeGLXNIDQInterface(SpikeGLXNIDQInterface):
             each of which is of length `ttl_duration` with a 0.1 second offset per channel.
         ttl_duration : float, default: 1.0
             How long the TTL pulses stays in the 'on' state when triggered, in seconds.
+        es_key : str, default: "ElectricalSeriesNIDQ"
         """
         from spikeinterface.extractors import NumpyRecording
 
@@ -113,9 +119,10 @@ class MockSpikeGLXNIDQInterface(SpikeGLXNIDQInterface):
 
         # Minimal meta so `get_metadata` works similarly to real NIDQ header
         self.meta = {"acqMnMaXaDw": "0,0,8,1", "fileCreateTime": "2020-11-03T10:35:10", "niDev1ProductName": "PCI-6259"}
+        self._device_metadata = get_device_metadata(self.meta)
         self.subset_channels = None
         self.verbose = None
-        self.es_key = "ElectricalSeriesNIDQ"
+        self.es_key = es_key
 
 
 class MockRecordingInterface(BaseRecordingExtractorInterface):
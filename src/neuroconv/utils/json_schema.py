@@ -1,8 +1,10 @@
 import collections.abc
 import inspect
 import json
+from copy import deepcopy
 from datetime import datetime
-from typing import Callable, Dict, List, Literal, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 
 import docstring_parser
 import hdmf.data_utils
@@ -62,6 +64,8 @@ def get_schema_from_method_signature(method: Callable, exclude: list = None) ->
     """
     Take a class method and return a json-schema of the input args.
 
+    The schema of each signature is only built once; later calls return a copy of the cached result.
+
     Parameters
     ----------
     method: function
@@ -72,10 +76,35 @@ def get_schema_from_method_signature(method: Callable, exclude: list = None) ->
     dict
 
     """
-    if exclude is None:
-        exclude = ["self", "kwargs"]
-    else:
-        exclude = exclude + ["self", "kwargs"]
+    # Key the cache on the underlying function so that bound methods do not keep their instances alive
+    function = getattr(method, "__func__", method)
+    is_bound_method = function is not method
+    exclude = tuple(exclude) if exclude is not None else tuple()
+
+    input_schema = _get_schema_from_function_signature(
+        function=function, is_bound_method=is_bound_method, exclude=exclude
+    )
+    return deepcopy(input_schema)
+
+
+@lru_cache(maxsize=None)
+def _get_schema_from_function_signature(function: Callable, is_bound_method: bool, exclude: Tuple[str, ...]) -> dict:
+    """
+    Build the json-schema of the input args of a function.
+
+    Parameters
+    ----------
+    function: function
+    is_bound_method: bool
+        Whether the function was bound to an instance or class, in which case its first argument is not an input.
+    exclude: tuple of strings
+
+    Returns
+    -------
+    dict
+
+    """
+    exclude = exclude + ("self", "kwargs")
     input_schema = get_base_schema()
     annotation_json_type_map = dict(
         bool="boolean",
@@ -89,8 +118,11 @@ def get_schema_from_method_signature(method: Callable, exclude: list = None) ->
         FolderPathType="string",
     )
     args_spec = dict()
-    parsed_docstring = docstring_parser.parse(method.__doc__)
-    for param_name, param in inspect.signature(method).parameters.items():
+    parsed_docstring = docstring_parser.parse(function.__doc__)
+    parameters = list(inspect.signature(function).parameters.items())
+    if is_bound_method:
+        parameters = parameters[1:]
+    for param_name, param in parameters:
         if param_name in exclude:
             continue
         args_spec[param_name] = dict()
@@ -145,7 +177,7 @@ def get_schema_from_method_signature(method: Callable, exclude: list = None) ->
                     input_schema["properties"].update({param_name: dict(format="directory")})
         else:
             raise NotImplementedError(
-                f"The annotation type of '{param}' in function '{method}' is not implemented! "
+                f"The annotation type of '{param}' in function '{function}' is not implemented! "
                 "Please request it to be added at github.com/catalystneuro/nwb-conversion-tools/issues "
                 "or create the json-schema for this method manually."
             )
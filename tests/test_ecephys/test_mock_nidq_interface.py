@@ -41,6 +41,34 @@ class TestMockSpikeGLXNIDQInterface(TestCase):
             inferred_ttl_times = interface.get_event_times_from_ttl(channel_name=channel_name)
             assert_array_almost_equal(x=inferred_ttl_times, y=custom_ttl_times[channel_index], decimal=4)
 
+    def test_buffered_inferred_ttl_times(self):
+        custom_ttl_times = [[1.2], [3.6], [0.7, 4.5], [5.1]]
+        interface = MockSpikeGLXNIDQInterface(ttl_times=custom_ttl_times)
+
+        channel_names = ["nidq#XA0", "nidq#XA1", "nidq#XA2", "nidq#XA3"]
+        for channel_index, channel_name in enumerate(channel_names):
+            inferred_ttl_times = interface.get_event_times_from_ttl(channel_name=channel_name, buffer_frames=12_345)
+            assert_array_almost_equal(x=inferred_ttl_times, y=custom_ttl_times[channel_index], decimal=4)
+
+    def test_explicit_threshold_inferred_ttl_times(self):
+        custom_ttl_times = [[1.2], [3.6], [0.7, 4.5], [5.1]]
+        interface = MockSpikeGLXNIDQInterface(ttl_times=custom_ttl_times)
+
+        channel_names = ["nidq#XA0", "nidq#XA1", "nidq#XA2", "nidq#XA3"]
+        for channel_index, channel_name in enumerate(channel_names):
+            trace = interface.recording_extractor.get_traces(channel_ids=[channel_name])
+            threshold = (float(trace.min()) + float(trace.max())) / 2
+            inferred_ttl_times = interface.get_event_times_from_ttl(
+                channel_name=channel_name, buffer_frames=12_345, threshold=threshold
+            )
+            assert_array_almost_equal(x=inferred_ttl_times, y=custom_ttl_times[channel_index], decimal=4)
+
+    def test_nonpositive_buffer_frames(self):
+        interface = MockSpikeGLXNIDQInterface()
+
+        with self.assertRaisesWith(exc_type=AssertionError, exc_msg="buffer_frames (-5) must be greater than zero!"):
+            interface.get_event_times_from_ttl(channel_name="nidq#XA0", buffer_frames=-5)
+
     def test_mock_metadata(self):
         interface = MockSpikeGLXNIDQInterface()
 
@@ -74,6 +102,20 @@ class TestMockSpikeGLXNIDQInterface(TestCase):
         expected_start_time = datetime(2020, 11, 3, 10, 35, 10)
         assert metadata["NWBFile"]["session_start_time"] == expected_start_time
 
+    def test_mock_metadata_custom_es_key(self):
+        interface = MockSpikeGLXNIDQInterface(es_key="ElectricalSeriesCustomNIDQ")
+
+        metadata = interface.get_metadata()
+
+        assert "ElectricalSeriesNIDQ" not in metadata["Ecephys"]
+        expected_electrical_series_metadata = {
+            "name": "ElectricalSeriesCustomNIDQ",
+            "description": "Raw acquisition traces from the NIDQ (.nidq.bin) channels.",
+        }
+        self.assertDictEqual(
+            d1=metadata["Ecephys"]["ElectricalSeriesCustomNIDQ"], d2=expected_electrical_series_metadata
+        )
+
     def test_mock_run_conversion(self):
         interface = MockSpikeGLXNIDQInterface()
 
@@ -462,6 +462,62 @@ class TestAddElectricalSeriesChunking(unittest.TestCase):
 
         assert electrical_series_data_iterator.chunk_shape == iterator_opts["chunk_shape"]
 
+    def test_default_buffer_shape_spans_all_channels(self):
+        recording = generate_recording(sampling_frequency=30_000.0, num_channels=100, durations=[60.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(recording=recording, buffer_gb=0.1)
+
+        assert iterator.chunk_shape == (39_062, 64)
+        assert iterator.buffer_shape == (234_372, 100)
+
+    def test_prefetch_iteration(self):
+        recording = generate_recording(sampling_frequency=1_000.0, num_channels=4, durations=[1.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(
+            recording=recording, buffer_shape=(300, 4), chunk_shape=(100, 4), prefetch=True
+        )
+
+        data_chunks = list(iterator)
+        assert [data_chunk.selection[0] for data_chunk in data_chunks] == [
+            slice(0, 300),
+            slice(300, 600),
+            slice(600, 900),
+            slice(900, 1000),
+        ]
+
+        extracted_data = np.concatenate([data_chunk.data for data_chunk in data_chunks])
+        expected_data = recording.get_traces(segment_index=0)
+        np.testing.assert_array_equal(expected_data, extracted_data)
+
+    def test_scaled_iteration(self):
+        recording = NumpyRecording(
+            traces_list=[np.arange(60, dtype="int16").reshape(20, 3)],
+            sampling_frequency=1.0,
+            channel_ids=["a", "b", "c"],
+        )
+        recording.set_channel_gains(gains=[0.5, 2.0, 3.0])
+        recording.set_channel_offsets(offsets=[1.0, -1.0, 0.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(
+            recording=recording, return_scaled=True, buffer_shape=(10, 2), chunk_shape=(5, 2)
+        )
+        assert iterator.dtype == np.dtype("float32")
+
+        extracted_data = np.zeros(shape=iterator.maxshape, dtype=iterator.dtype)
+        for data_chunk in iterator:
+            extracted_data[data_chunk.selection] = data_chunk.data
+        expected_data = recording.get_traces(segment_index=0, return_scaled=True)
+        np.testing.assert_array_equal(expected_data, extracted_data)
+
+    def test_read_window_iteration(self):
+        recording = generate_recording(sampling_frequency=1_000.0, num_channels=4, durations=[1.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(
+            recording=recording, buffer_shape=(200, 2), chunk_shape=(100, 2), read_window_factor=3, prefetch=True
+        )
+
+        extracted_data = np.zeros(shape=iterator.maxshape, dtype=iterator.dtype)
+        for data_chunk in iterator:
+            extracted_data[data_chunk.selection] = data_chunk.data
+        expected_data = recording.get_traces(segment_index=0)
+        np.testing.assert_array_equal(expected_data, extracted_data)
+
     def test_hdfm_iterator(self):
         add_electrical_series(recording=self.test_recording_extractor, nwbfile=self.nwbfile, iterator_type="v1")
 
@@ -1,3 +1,5 @@
+import numpy as np
+
 from neuroconv.tools.data_transfers import (
     estimate_s3_conversion_cost,
     estimate_total_conversion_runtime,
@@ -26,6 +28,13 @@ def test_estimate_s3_conversion_cost_standard():
     ]
 
 
+def test_estimate_s3_conversion_cost_array():
+    test_sizes = np.array([1, 100, 1e3, 1e5, 1e6, 1e7, 1e8])
+    results = estimate_s3_conversion_cost(total_mb=test_sizes)
+    expected_results = [estimate_s3_conversion_cost(total_mb=total_mb) for total_mb in test_sizes]
+    np.testing.assert_array_equal(results, expected_results)
+
+
 def test_estimate_total_conversion_runtime():
     test_sizes = [
         1,
@@ -2,7 +2,10 @@
 
 from typing import Union
 
+import numpy as np
 import pytest
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
 
 from neuroconv.tools.nwb_helpers import (
     HDF5DatasetIOConfiguration,
@@ -137,3 +140,41 @@ def test_validator_chunk_dimensions_do_not_evenly_divide_buffer_skip_full_shape(
 ):
     """Any divisibility is allowed when the buffer shape is capped at the full length of an axis."""
     dataset_configuration_class(chunk_shape=(78_125, 7), buffer_shape=(1_250_000, 384))
+
+
+@pytest.mark.parametrize(
+    argnames="dataset_configuration_class", argvalues=[mock_HDF5DatasetIOConfiguration, mock_ZarrDatasetIOConfiguration]
+)
+def test_hash_is_stable_when_configured(
+    dataset_configuration_class: Union[HDF5DatasetIOConfiguration, ZarrDatasetIOConfiguration]
+):
+    dataset_configuration = dataset_configuration_class()
+    same_dataset_configuration = dataset_configuration_class()
+    assert hash(dataset_configuration) == hash(same_dataset_configuration)
+
+    original_hash = hash(dataset_configuration)
+    dataset_configuration.chunk_shape = (78_125, 128)
+    assert hash(dataset_configuration) == original_hash
+    assert {dataset_configuration: "configured"}[dataset_configuration] == "configured"
+
+
+@pytest.mark.parametrize(
+    argnames="dataset_configuration_class", argvalues=[HDF5DatasetIOConfiguration, ZarrDatasetIOConfiguration]
+)
+def test_from_neurodata_object_trusted_matches_validated(
+    dataset_configuration_class: Union[HDF5DatasetIOConfiguration, ZarrDatasetIOConfiguration]
+):
+    nwbfile = mock_NWBFile()
+    time_series = mock_TimeSeries(name="TestTimeSeries", data=np.zeros(shape=(1_000, 4), dtype="int16"))
+    nwbfile.add_acquisition(time_series)
+
+    trusted_configuration = dataset_configuration_class.from_neurodata_object_trusted(
+        neurodata_object=time_series, dataset_name="data"
+    )
+    validated_configuration = dataset_configuration_class.from_neurodata_object(
+        neurodata_object=time_series, dataset_name="data"
+    )
+    assert trusted_configuration == validated_configuration
+
+    with pytest.raises(ValueError):
+        trusted_configuration.chunk_shape = (10,)
@@ -145,3 +145,35 @@ def test_unwrapped_dynamic_table_zarr(zarr_nwbfile_path):
     assert dataset_configuration.compression_options is None
     assert dataset_configuration.filter_methods is None
     assert dataset_configuration.filter_options is None
+
+
+def test_detected_backend_hdf5(hdf5_nwbfile_path):
+    array = np.array([[1, 2, 3], [4, 5, 6]])
+
+    with NWBHDF5IO(path=hdf5_nwbfile_path, mode="a") as io:
+        nwbfile = io.read()
+        new_time_series = mock_TimeSeries(name="NewDetectedTimeSeries", data=array)
+        nwbfile.add_acquisition(new_time_series)
+        dataset_configurations = list(get_default_dataset_io_configurations(nwbfile=nwbfile))
+
+    assert len(dataset_configurations) == 1
+
+    dataset_configuration = dataset_configurations[0]
+    assert isinstance(dataset_configuration, HDF5DatasetIOConfiguration)
+    assert dataset_configuration.object_id == new_time_series.object_id
+
+
+def test_detected_backend_zarr(zarr_nwbfile_path):
+    array = np.array([[1, 2, 3], [4, 5, 6]])
+
+    with NWBZarrIO(path=zarr_nwbfile_path, mode="a") as io:
+        nwbfile = io.read()
+        new_time_series = mock_TimeSeries(name="NewDetectedTimeSeries", data=array)
+        nwbfile.add_acquisition(new_time_series)
+        dataset_configurations = list(get_default_dataset_io_configurations(nwbfile=nwbfile))
+
+    assert len(dataset_configurations) == 1
+
+    dataset_configuration = dataset_configurations[0]
+    assert isinstance(dataset_configuration, ZarrDatasetIOConfiguration)
+    assert dataset_configuration.object_id == new_time_series.object_id
@@ -164,3 +164,25 @@ class TestGetRisingAndFallingTimesFromTTL(TestCase):
 
         expected_falling_frames = np.array([77_500, 205_000])
         assert_array_equal(x=falling_frames, y=expected_falling_frames)
+
+    def test_custom_integer_threshold_unsigned(self):
+        ttl_signal = np.array([0, 0, 5, 5, 0, 0, 5], dtype="uint16")
+
+        rising_frames = get_rising_frames_from_ttl(trace=ttl_signal, threshold=2)
+        falling_frames = get_falling_frames_from_ttl(trace=ttl_signal, threshold=2)
+
+        expected_rising_frames = np.array([2, 6])
+        assert_array_equal(x=rising_frames, y=expected_rising_frames)
+
+        expected_falling_frames = np.array([4])
+        assert_array_equal(x=falling_frames, y=expected_falling_frames)
+
+    def test_custom_threshold_with_nan_gaps(self):
+        ttl_signal = np.array([0.0, np.nan, 5.0, 5.0, np.nan, 0.0])
+
+        rising_frames = get_rising_frames_from_ttl(trace=ttl_signal, threshold=2.0)
+        falling_frames = get_falling_frames_from_ttl(trace=ttl_signal, threshold=2.0)
+
+        expected_frames = np.array([], dtype="int64")
+        assert_array_equal(x=rising_frames, y=expected_frames)
+        assert_array_equal(x=falling_frames, y=expected_frames)
@@ -68,6 +68,25 @@ def test_get_schema_from_method_signature():
     assert schema == correct_schema
 
 
+def test_get_schema_from_method_signature_cached_copies():
+    class A:
+        def __init__(self, a: int, b: str = "hi"):
+            pass
+
+        @classmethod
+        def from_a(cls, a: int):
+            pass
+
+    schema = get_schema_from_method_signature(A.__init__, exclude=["b"])
+    schema["properties"]["a"]["description"] = "Modified by the caller."
+
+    assert get_schema_from_method_signature(A.__init__, exclude=["b"]) == dict(
+        additionalProperties=False, properties=dict(a=dict(type="number")), required=["a"], type="object"
+    )
+    assert get_schema_from_method_signature(A(a=1).__init__) == get_schema_from_method_signature(A.__init__)
+    assert get_schema_from_method_signature(A.from_a)["required"] == ["a"]
+
+
 def test_dict_deep_update_1():
     # 1. test the updating of two dicts with all keys and values as immutable elements
     a1 = dict(a=1, b="hello", c=23)